@@ -22,7 +22,7 @@ from discord.app_commands import Choice
 from discord import AppCommandOptionType
 
 # Import additional helper functions from discord_compat
-from utils.discord_compat import command, describe, autocomplete, guild_only
+from utils.discord_compat import command, describe, autocomplete, guild_only, TreeBot
 
 # Log successful import
 logger = logging.getLogger('bot')
@@ -82,7 +82,7 @@ async def initialize_bot(force_sync=False):
     # Create bot instance with hardcoded owner ID
     # Using proper py-cord Bot initialization with type hints
     
-    class PvPBot(Bot):
+    class PvPBot(TreeBot):
         """Custom Bot class with additional attributes for our application"""
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
@@ -4,18 +4,80 @@ Guild model for Tower of Temptation PvP Statistics Bot
 This module defines the Guild data structure for Discord guilds.
 """
 import logging
+import re
 from datetime import datetime
 from typing import Dict, Any, Optional, ClassVar, List, Union, Tuple, cast
 import uuid
 
+from pymongo import ReturnDocument
+from pymongo.write_concern import WriteConcern
+
+from config import DEFAULT_COLOR_PRIMARY, DEFAULT_COLOR_SECONDARY, DEFAULT_COLOR_ACCENT
 from models.base_model import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Whitespace-delimited run of 4+ digits, used to find a game server ID in a server name
+_NUMERIC_ID_RE = re.compile(r"(?<!\S)\d{4,}(?!\S)")
+
+def _coerce_premium_tier(value: Any) -> int:
+    """Convert a stored premium_tier value (int, float, numeric string or None) to an int
+
+    Args:
+        value: Raw premium_tier value
+
+    Returns:
+        int: Premium tier, or 0 if the value is missing or invalid
+    """
+    # Fast path: tiers are almost always stored as ints already
+    if value.__class__ is int:
+        return value
+    if value is None:
+        return 0
+    try:
+        # int() also strips surrounding whitespace from strings
+        return int(value)
+    except (ValueError, TypeError, OverflowError):
+        logger.warning(f"Invalid premium_tier value: {value!r}, defaulting to 0")
+        return 0
+
 class Guild(BaseModel):
     """Discord guild configuration"""
     collection_name: ClassVar[Optional[str]] = "guilds"
 
+    # Attributes set explicitly by __init__; other keyword arguments are kept as extras
+    _KNOWN_FIELDS: ClassVar[frozenset] = frozenset({
+        "_id",
+        "db",
+        "guild_id",
+        "name",
+        "premium_tier",
+        "admin_role_id",
+        "admin_users",
+        "servers",
+        "color_primary",
+        "color_secondary",
+        "color_accent",
+        "icon_url",
+        "created_at",
+        "updated_at",
+    })
+
+    # Names extra keyword arguments may not take: the known fields plus every
+    # class attribute and method; filled in after the class body
+    _RESERVED: ClassVar[frozenset] = frozenset()
+
+    # Scalar fields that may be written through apply_updates
+    _UPDATABLE_FIELDS: ClassVar[frozenset] = frozenset({
+        "name",
+        "premium_tier",
+        "admin_role_id",
+        "color_primary",
+        "color_secondary",
+        "color_accent",
+        "icon_url",
+    })
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert Guild object to dictionary
         
@@ -28,7 +90,7 @@ class Guild(BaseModel):
             "name": self.name,
             "premium_tier": self.premium_tier,
             "admin_role_id": self.admin_role_id,
-            "admin_users": self.admin_users,
+            "admin_users": list(self.admin_users),
             "servers": self.servers,
             "color_primary": self.color_primary,
             "color_secondary": self.color_secondary, 
@@ -47,9 +109,9 @@ class Guild(BaseModel):
         admin_role_id: Optional[str] = None,
         admin_users: Optional[List[str]] = None,
         servers: Optional[List[Dict[str, Any]]] = None,
-        color_primary: str = "#7289DA",
-        color_secondary: str = "#FFFFFF",
-        color_accent: str = "#23272A",
+        color_primary: str = DEFAULT_COLOR_PRIMARY,
+        color_secondary: str = DEFAULT_COLOR_SECONDARY,
+        color_accent: str = DEFAULT_COLOR_ACCENT,
         icon_url: Optional[str] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
@@ -61,20 +123,26 @@ class Guild(BaseModel):
         self.name = name
         self.premium_tier = premium_tier
         self.admin_role_id = admin_role_id
-        self.admin_users = admin_users or []
+        # Stored as an insertion-ordered dict (keys only) for O(1) membership
+        # checks; serialized as a list in the order users were added
+        self.admin_users: Dict[str, None] = dict.fromkeys(admin_users or [])
         self.color_primary = color_primary
         self.color_secondary = color_secondary
         self.color_accent = color_accent
         self.icon_url = icon_url
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        now = datetime.utcnow()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
 
         self.servers = servers or []
 
-        # Add any additional guild attributes
-        for key, value in kwargs.items():
-            if not hasattr(self, key):
-                setattr(self, key, value)
+        # Add any additional guild attributes, never shadowing fields set above
+        # or methods and attributes defined on the class
+        reserved = self._RESERVED
+        self.__dict__.update({
+            key: value for key, value in kwargs.items()
+            if key not in reserved
+        })
 
     async def add_server(self, server_data: Dict[str, Any]) -> bool:
         """Add a server to the guild
@@ -99,17 +167,18 @@ class Guild(BaseModel):
             original_server_id = None
             
             # If server_id is not in UUID format, use it directly
-            if server_id and ("-" not in server_id or len(server_id) < 30):
+            # (UUID-like means hyphenated and at least 30 characters long)
+            server_id_str = str(server_id)
+            if server_id and ("-" not in server_id_str or len(server_id_str) < 30):
                 logger.info(f"Using non-UUID server_id as original_server_id: {server_id}")
                 original_server_id = server_id
             # Otherwise try to extract from server name
             elif server_name:
                 # Look for numeric ID in server name
-                for word in str(server_name).split():
-                    if word.isdigit() and len(word) >= 4:
-                        logger.info(f"Found potential numeric server ID in server_name: {word}")
-                        original_server_id = word
-                        break
+                match = _NUMERIC_ID_RE.search(str(server_name))
+                if match:
+                    original_server_id = match.group(0)
+                    logger.info(f"Found potential numeric server ID in server_name: {original_server_id}")
             
             # Set the original_server_id in server_data
             if original_server_id:
@@ -126,14 +195,12 @@ class Guild(BaseModel):
         self.servers.append(server_data)
         self.updated_at = datetime.utcnow()
 
-        # Update in database
+        # Update in database, appending only the new entry instead of rewriting the array
         result = await self.db.guilds.update_one(
             {"guild_id": self.guild_id},
             {
-                "$set": {
-                    "servers": self.servers,
-                    "updated_at": self.updated_at
-                }
+                "$push": {"servers": {"$each": [server_data]}},
+                "$set": {"updated_at": self.updated_at}
             }
         )
         
@@ -195,6 +262,7 @@ class Guild(BaseModel):
 
         # Import standardize_server_id here to avoid circular imports
         from utils.server_utils import standardize_server_id
+        from utils.database import SERVER_ID_COLLATION
         
         # Standardize the server_id to ensure consistent formatting
         standardized_server_id = standardize_server_id(server_id)
@@ -215,47 +283,31 @@ class Guild(BaseModel):
             self.servers = []
             
         # Log all existing servers for debugging
-        logger.info(f"Current servers in guild {self.guild_id}:")
-        for i, s in enumerate(self.servers):
-            s_id = s.get("server_id")
-            s_name = s.get("server_name", "Unknown")
-            std_id = standardize_server_id(s_id)
-            logger.info(f"  - Server {i}: ID={s_id}, StdID={std_id}, Name={s_name}, Type={type(s_id)}")
-        
-        # First try exact match
-        found_exact = False
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Current servers in guild {self.guild_id}:")
+            for i, s in enumerate(self.servers):
+                s_id = s.get("server_id")
+                s_name = s.get("server_name", "Unknown")
+                std_id = standardize_server_id(s_id)
+                logger.debug(f"  - Server {i}: ID={s_id}, StdID={std_id}, Name={s_name}, Type={type(s_id)}")
+        
+        # Collect every server_id representation that should be removed: the
+        # standardized form, the raw string, its numeric form, and the stored
+        # values of any entries that standardize to the same ID
+        candidates = {standardized_server_id, str_server_id}
+        if standardized_server_id.isdigit():
+            candidates.add(int(standardized_server_id))
+
+        remaining_servers = []
         for s in self.servers:
-            if s.get("server_id") == standardized_server_id:
-                found_exact = True
-                logger.info(f"Found exact match for server ID {standardized_server_id}")
-                break
-                
-        # Find and remove server from guild.servers, using standardized comparison
-        original_server_count = len(self.servers)
-        
-        # Try different matching approaches if needed
-        if found_exact:
-            # Use exact matching first
-            self.servers = [s for s in self.servers if s.get("server_id") != standardized_server_id]
-        else:
-            # Try case-insensitive standardized matching
-            logger.info(f"No exact match found, using standardized comparison")
-            self.servers = [s for s in self.servers if standardize_server_id(s.get("server_id")) != standardized_server_id]
-            
-            # Also try direct string comparison with raw server_id
-            if len(self.servers) == original_server_count:
-                logger.info(f"No matches with standardized comparison, trying raw string comparison")
-                self.servers = [s for s in self.servers if str(s.get("server_id")) != str_server_id]
-            
-            # Last resort: try numeric comparison if server_id is numeric
-            if standardized_server_id.isdigit() and len(self.servers) == original_server_count:
-                logger.info(f"No matches with string comparison, trying numeric comparison")
-                numeric_id = int(standardized_server_id)
-                self.servers = [s for s in self.servers if (
-                    not str(s.get("server_id")).isdigit() or int(s.get("server_id")) != numeric_id
-                )]
-        
-        servers_removed = original_server_count - len(self.servers)
+            s_id = s.get("server_id")
+            if s_id in candidates or standardize_server_id(s_id) == standardized_server_id:
+                candidates.add(s_id)
+            else:
+                remaining_servers.append(s)
+
+        servers_removed = len(self.servers) - len(remaining_servers)
+        self.servers = remaining_servers
         
         if servers_removed > 0:
             logger.info(f"Removed {servers_removed} server entries from guild.servers array")
@@ -264,61 +316,26 @@ class Guild(BaseModel):
             
         self.updated_at = datetime.utcnow()
 
-        # Update guild in database
+        # Update guild in database, letting MongoDB pull the matching entries
         guild_result = await self.db.guilds.update_one(
             {"guild_id": self.guild_id},
             {
-                "$set": {
-                    "servers": self.servers,
-                    "updated_at": self.updated_at
-                }
+                "$pull": {"servers": {"server_id": {"$in": list(candidates)}}},
+                "$set": {"updated_at": self.updated_at}
             }
         )
         
-        # Try multiple approaches to remove from standalone servers collection
-        # 1. First try exact match
-        standalone_exact = await self.db.servers.delete_many({"server_id": standardized_server_id})
-        
-        # 2. Try case-insensitive regex match
-        standalone_query = {"server_id": {"$regex": f"^{standardized_server_id}$", "$options": "i"}}
-        standalone_result = await self.db.servers.delete_many(standalone_query)
-        
-        # 3. If server ID is numeric, try numeric match
-        standalone_numeric = 0
-        if standardized_server_id.isdigit():
-            try:
-                numeric_id = int(standardized_server_id)
-                numeric_result = await self.db.servers.delete_many({"server_id": numeric_id})
-                standalone_numeric = numeric_result.deleted_count
-            except:
-                pass
-                
-        # Similar approaches for game_servers collection
-        # 1. Exact match
-        game_exact = await self.db.game_servers.delete_many({"server_id": standardized_server_id})
-        
-        # 2. Case-insensitive match
-        game_servers_query = {"server_id": {"$regex": f"^{standardized_server_id}$", "$options": "i"}}
-        game_regex = await self.db.game_servers.delete_many(game_servers_query)
-        
-        # 3. Numeric match if applicable
-        game_numeric = 0
-        if standardized_server_id.isdigit():
-            try:
-                numeric_id = int(standardized_server_id)
-                numeric_result = await self.db.game_servers.delete_many({"server_id": numeric_id})
-                game_numeric = numeric_result.deleted_count
-            except:
-                pass
-        
-        # Combine all deletion counts
-        standalone_count = standalone_exact.deleted_count + standalone_result.deleted_count + standalone_numeric
-        game_count = game_exact.deleted_count + game_regex.deleted_count + game_numeric
+        # Remove from the standalone collections with one query each; server_id
+        # is not stored lowercased, so match case-insensitively through the
+        # collation of the server_id_ci indexes
+        server_id_query = {"server_id": {"$in": list(candidates)}}
+        standalone_result = await self.db.servers.delete_many(server_id_query, collation=SERVER_ID_COLLATION)
+        game_result = await self.db.game_servers.delete_many(server_id_query, collation=SERVER_ID_COLLATION)
+        standalone_count = standalone_result.deleted_count
+        game_count = game_result.deleted_count
         
         # Log detailed deletion results
-        logger.info(f"Server removal results - Guild: {guild_result.modified_count}")
-        logger.info(f"Servers collection - Exact: {standalone_exact.deleted_count}, Regex: {standalone_result.deleted_count}, Numeric: {standalone_numeric}")
-        logger.info(f"Game servers - Exact: {game_exact.deleted_count}, Regex: {game_regex.deleted_count}, Numeric: {game_numeric}")
+        logger.info(f"Server removal results - Guild: {guild_result.modified_count}, Servers collection: {standalone_count}, Game servers: {game_count}")
 
         return guild_result.modified_count > 0 or standalone_count > 0 or game_count > 0
 
@@ -418,21 +435,9 @@ class Guild(BaseModel):
         # Log the tier change
         logger.info(f"Setting premium tier for guild {self.guild_id}: {self.premium_tier} -> {tier_int}")
             
-        # Set tier in model
-        self.premium_tier = tier_int
-        self.updated_at = datetime.utcnow()
-
-        # Update in database
+        # Update model and database in a single write
         try:
-            result = await db.guilds.update_one(
-                {"guild_id": self.guild_id},
-                {"$set": {
-                    "premium_tier": tier_int,  # Explicitly use tier_int for db storage
-                    "updated_at": self.updated_at
-                }}
-            )
-            
-            success = result.modified_count > 0
+            success = await self.apply_updates(db, premium_tier=tier_int)
             if success:
                 logger.info(f"Successfully updated premium tier for guild {self.guild_id} to {tier_int}")
             else:
@@ -453,19 +458,7 @@ class Guild(BaseModel):
         Returns:
             True if updated successfully, False otherwise
         """
-        self.admin_role_id = role_id
-        self.updated_at = datetime.utcnow()
-
-        # Update in database
-        result = await db.guilds.update_one(
-            {"guild_id": self.guild_id},
-            {"$set": {
-                "admin_role_id": self.admin_role_id,
-                "updated_at": self.updated_at
-            }}
-        )
-
-        return result.modified_count > 0
+        return await self.apply_updates(db, admin_role_id=role_id)
 
     async def add_admin_user(self, db, user_id: str) -> bool:
         """Add admin user for guild
@@ -477,22 +470,19 @@ class Guild(BaseModel):
         Returns:
             True if updated successfully, False otherwise
         """
-        if not hasattr(self, "admin_users"):
-            self.admin_users = []
-
         if user_id in self.admin_users:
             return True
 
-        self.admin_users.append(user_id)
+        self.admin_users[user_id] = None
         self.updated_at = datetime.utcnow()
 
-        # Update in database
+        # Update in database, adding the single user server-side
         result = await db.guilds.update_one(
             {"guild_id": self.guild_id},
-            {"$set": {
-                "admin_users": self.admin_users,
-                "updated_at": self.updated_at
-            }}
+            {
+                "$addToSet": {"admin_users": user_id},
+                "$set": {"updated_at": self.updated_at}
+            }
         )
 
         return result.modified_count > 0
@@ -507,24 +497,24 @@ class Guild(BaseModel):
         Returns:
             True if updated successfully, False otherwise
         """
-        if not hasattr(self, "admin_users") or user_id not in self.admin_users:
+        if user_id not in self.admin_users:
             return True
 
-        self.admin_users.remove(user_id)
+        self.admin_users.pop(user_id, None)
         self.updated_at = datetime.utcnow()
 
-        # Update in database
+        # Update in database, removing the single user server-side
         result = await db.guilds.update_one(
             {"guild_id": self.guild_id},
-            {"$set": {
-                "admin_users": self.admin_users,
-                "updated_at": self.updated_at
-            }}
+            {
+                "$pull": {"admin_users": user_id},
+                "$set": {"updated_at": self.updated_at}
+            }
         )
 
         return result.modified_count > 0
 
-    async def update_theme(self, db, color_primary: Optional[str] = None, color_secondary: Optional[str] = None, color_accent: Optional[str] = None, icon_url: Optional[str] = None) -> bool:
+    async def update_theme(self, db, color_primary: Optional[str] = None, color_secondary: Optional[str] = None, color_accent: Optional[str] = None, icon_url: Optional[str] = None, fire_and_forget: bool = False) -> bool:
         """Update theme colors for guild
 
         Args:
@@ -533,44 +523,68 @@ class Guild(BaseModel):
             color_secondary: Secondary color (hex)
             color_accent: Accent color (hex)
             icon_url: Icon URL
+            fire_and_forget: Send the write unacknowledged (w=0) since theme
+                changes are cosmetic
 
         Returns:
-            True if updated successfully, False otherwise
+            True if updated successfully (always True when fire_and_forget), False otherwise
         """
-        # Timestamp for the update
-        update_timestamp = datetime.utcnow()
-        
-        # Create the update dictionary with only the fields to update
-        # This avoids including color fields that might have non-datetime values
-        update_dict = {}
-        update_dict["updated_at"] = update_timestamp
-
-        # Only add fields that are explicitly being updated
+        # Only include fields that are explicitly being updated
+        fields = {}
         if color_primary is not None:
-            self.color_primary = color_primary
-            update_dict["color_primary"] = color_primary
-
+            fields["color_primary"] = color_primary
         if color_secondary is not None:
-            self.color_secondary = color_secondary
-            update_dict["color_secondary"] = color_secondary
-
+            fields["color_secondary"] = color_secondary
         if color_accent is not None:
-            self.color_accent = color_accent
-            update_dict["color_accent"] = color_accent
-
+            fields["color_accent"] = color_accent
         if icon_url is not None:
-            self.icon_url = icon_url
-            update_dict["icon_url"] = icon_url
+            fields["icon_url"] = icon_url
+
+        return await self.apply_updates(db, fire_and_forget=fire_and_forget, **fields)
 
-        # Update the instance timestamp
-        self.updated_at = update_timestamp
+    async def apply_updates(self, db=None, *, fire_and_forget: bool = False, **fields) -> bool:
+        """Apply several field changes to the guild with a single database write
+
+        Lets setup flows combine e.g. a premium tier and theme change into one
+        ``$set`` instead of issuing an update per field.
+
+        Args:
+            db: Database connection (defaults to the guild's own connection)
+            fire_and_forget: Send the write unacknowledged (w=0) without waiting
+                for the server; only use for non-critical fields
+            **fields: Field values to set, limited to updatable guild fields
+
+        Returns:
+            True if updated successfully (always True when fire_and_forget), False otherwise
+
+        Raises:
+            ValueError: If an unknown field is passed
+        """
+        unknown = fields.keys() - self._UPDATABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot update unknown guild fields: {', '.join(sorted(unknown))}")
+
+        if db is None:
+            db = self.db
+
+        # Apply to the model
+        for key, value in fields.items():
+            setattr(self, key, value)
+        self.updated_at = datetime.utcnow()
+        fields["updated_at"] = self.updated_at
 
         # Update in database
-        result = await db.guilds.update_one(
+        collection = db.guilds
+        if fire_and_forget:
+            collection = collection.with_options(write_concern=WriteConcern(w=0))
+        result = await collection.update_one(
             {"guild_id": self.guild_id},
-            {"$set": update_dict}
+            {"$set": fields}
         )
 
+        # Unacknowledged writes carry no modified_count
+        if fire_and_forget:
+            return True
         return result.modified_count > 0
 
     @classmethod
@@ -618,24 +632,35 @@ class Guild(BaseModel):
         Returns:
             Guild object or None if retrieval/creation failed
         """
-        # First try to get the existing guild
-        guild = await cls.get_by_id(db, guild_id)
-        
-        # If guild exists, return it directly
-        if guild is not None:
-            return guild
+        if guild_id is None:
+            logger.warning("Attempted to get or create guild with None guild_id")
+            return None
             
-        # Otherwise create a new guild with basic information
+        string_guild_id = str(guild_id)
         if guild_name is None:
             guild_name = f"Guild {guild_id}"
             
-        # Create the guild with minimal setup
+        # Fetch or insert atomically in one round-trip, so concurrent handlers
+        # cannot both create the same guild
+        now = datetime.utcnow()
         try:
-            logger.info(f"Auto-creating guild during feature access: {guild_id}")
-            return await cls.create(db, guild_id, guild_name)
+            document = await db.guilds.find_one_and_update(
+                {"guild_id": string_guild_id},
+                {"$setOnInsert": {
+                    "guild_id": string_guild_id,
+                    "name": guild_name,
+                    "premium_tier": 0,
+                    "created_at": now,
+                    "updated_at": now
+                }},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
         except Exception as e:
             logger.error(f"Error auto-creating guild during feature access: {e}")
             return None
+            
+        return cls.create_from_db_document(document, db)
 
     @classmethod
     async def create(cls, db, guild_id: str, name: str) -> Optional['Guild']:
@@ -650,12 +675,13 @@ class Guild(BaseModel):
             Created Guild object or None if creation failed
         """
         # Create document
+        now = datetime.utcnow()
         document = {
             "guild_id": str(guild_id),
             "name": name,
             "premium_tier": 0,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
 
         # Insert into database
@@ -673,8 +699,8 @@ class Guild(BaseModel):
         """Check if this guild has access to a premium feature
         
         This comprehensive method implements proper tier inheritance, ensuring that
-        higher tiers have access to all features from lower tiers. It checks
-        feature access using multiple methods to ensure reliability.
+        higher tiers have access to all features from lower tiers. Access is
+        resolved from a per-tier feature bitmask built once at import time.
 
         Args:
             feature_name: Name of the feature to check
@@ -682,44 +708,15 @@ class Guild(BaseModel):
         Returns:
             True if the guild has access to the feature, False otherwise
         """
-        from config import PREMIUM_TIERS
-        from utils.premium import PREMIUM_FEATURES
+        from utils.premium import tier_has_feature
 
-        # Log for debugging purposes
-        logger.info(f"Checking feature access for '{feature_name}' in guild with tier {self.premium_tier}")
-        
         # Make sure premium_tier is an integer (fix for potential string storage issue)
-        try:
-            premium_tier = int(self.premium_tier) if self.premium_tier is not None else 0
-        except (ValueError, TypeError):
-            logger.warning(f"Invalid premium_tier value: {self.premium_tier}, defaulting to 0")
-            premium_tier = 0
-        
-        # Method 1: Check using direct PREMIUM_FEATURES mapping (most efficient)
-        # This implements tier inheritance by checking if current tier >= required tier
-        if feature_name in PREMIUM_FEATURES:
-            min_tier_required = PREMIUM_FEATURES.get(feature_name, 999)  # Default to high tier if not found
-            has_access = premium_tier >= min_tier_required
-            logger.info(f"Feature check via PREMIUM_FEATURES: feature '{feature_name}' requires tier {min_tier_required}, guild has tier {premium_tier}, access: {has_access}")
-            if has_access:
-                return True
-        
-        # Method 2: Check using inherited features from all tiers up to and including current tier
-        all_features = []
-        
-        # Gather features from all tiers up to and including the current tier
-        # This implements tier inheritance by explicitly collecting features from all lower tiers
-        for tier_level in range(premium_tier + 1):
-            tier_info = PREMIUM_TIERS.get(tier_level)
-            if tier_info:
-                tier_features = tier_info.get("features", [])
-                for feature in tier_features:
-                    if feature not in all_features:
-                        all_features.append(feature)
-        
-        logger.info(f"Available features after tier inheritance (0 to {premium_tier}): {all_features}")
-        has_access = feature_name in all_features
-        logger.info(f"Guild access to '{feature_name}': {has_access}")
+        premium_tier = _coerce_premium_tier(self.premium_tier)
+        
+        # Tier inheritance is precomputed into a per-tier feature bitmask, covering
+        # both PREMIUM_FEATURES minimum tiers and the cumulative PREMIUM_TIERS lists
+        has_access = tier_has_feature(premium_tier, feature_name)
+        logger.debug("Guild access to '%s' with tier %s: %s", feature_name, premium_tier, has_access)
         
         return has_access
 
@@ -730,72 +727,13 @@ class Guild(BaseModel):
         This method ensures higher tiers have access to all features from lower tiers,
         implementing a comprehensive tier inheritance system.
         """
-        from config import PREMIUM_TIERS
-        from utils.premium import PREMIUM_FEATURES
-        
-        # DEBUG: Add more detailed logging to track premium tier values
-        logger.info(f"PREMIUM DEBUG: Raw premium_tier value: '{self.premium_tier}', type: {type(self.premium_tier)}")
+        from utils.premium import get_tier_features
         
         # Make sure premium_tier is an integer (fix for potential string storage issue)
-        try:
-            # First check direct numeric conversion
-            if isinstance(self.premium_tier, (int, float)):
-                premium_tier = int(self.premium_tier)
-            # Then try string conversion if it's a string
-            elif isinstance(self.premium_tier, str) and self.premium_tier.strip().isdigit():
-                premium_tier = int(self.premium_tier.strip())
-            # Handle None case
-            elif self.premium_tier is None:
-                premium_tier = 0
-                logger.warning("Premium tier is None, defaulting to 0")
-            else:
-                # Last resort, try direct conversion
-                premium_tier = int(self.premium_tier)
-                
-            logger.info(f"PREMIUM DEBUG: Converted premium_tier: {premium_tier}")
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid premium_tier value in get_available_features: {self.premium_tier}, error: {str(e)}, defaulting to 0")
-            premium_tier = 0
-        
-        # Initialize feature list with all features accessible at this tier level
-        all_features = []
-        
-        # Method 1: Collect features from all tiers up to and including this tier
-        # This ensures proper tier inheritance - higher tiers include all features from lower tiers
-        for tier_level in range(premium_tier + 1):
-            tier_info = PREMIUM_TIERS.get(tier_level)
-            if tier_info:
-                tier_features = tier_info.get("features", [])
-                for feature in tier_features:
-                    if feature not in all_features:
-                        all_features.append(feature)
-        
-        # If no features were found via tier inheritance, use tier 0 as fallback
-        if not all_features:
-            logger.warning(f"No tier info found for any tier up to {premium_tier} in get_available_features, using tier 0 as fallback")
-            tier_info = PREMIUM_TIERS.get(0, {})
-            all_features = tier_info.get("features", [])
-        
-        logger.info(f"PREMIUM DEBUG: Features from tier inheritance (0 to {premium_tier}): {all_features}")
-        
-        # Method 2: Supplement with direct feature minimum tier mapping
-        # This is a backup approach to ensure all features are included
-        supplemental_features = []
-        for feature, min_tier in PREMIUM_FEATURES.items():
-            if premium_tier >= min_tier:
-                # Only add if not already in the list
-                if feature not in all_features:
-                    supplemental_features.append(feature)
-        
-        if supplemental_features:
-            logger.info(f"PREMIUM DEBUG: Additional features from PREMIUM_FEATURES: {supplemental_features}")
-            all_features.extend(supplemental_features)
-        
-        # Ensure no duplicate features
-        unique_features = list(set(all_features))
-        logger.info(f"PREMIUM DEBUG: Final feature set for tier {premium_tier}: {unique_features}")
-            
-        return unique_features
+        premium_tier = _coerce_premium_tier(self.premium_tier)
+        
+        # Tier inheritance is precomputed per tier at import time
+        return list(get_tier_features(premium_tier))
 
     @classmethod
     def create_from_db_document(cls, document: Dict[str, Any], db=None) -> Optional['Guild']:
@@ -814,32 +752,16 @@ class Guild(BaseModel):
         if document is None:
             return None
         
-        # Extract and properly convert premium_tier to int before initializing
-        # This ensures premium tier is always stored as an integer
-        document_copy = document.copy()
-        
-        # Handle premium_tier conversion specifically
-        if 'premium_tier' in document_copy:
-            try:
-                # Convert premium_tier to integer
-                premium_tier_value = document_copy['premium_tier']
-                if premium_tier_value is not None:
-                    # Ensure it's an integer
-                    document_copy['premium_tier'] = int(premium_tier_value)
-                    logger.info(f"Loaded premium_tier from database: {document_copy['premium_tier']} (original type: {type(premium_tier_value).__name__})")
-                else:
-                    # Default to 0 if None
-                    document_copy['premium_tier'] = 0
-                    logger.warning("Premium tier is None in database, defaulting to 0")
-            except (ValueError, TypeError) as e:
-                logger.error(f"Error converting premium_tier '{document_copy['premium_tier']}': {e}, defaulting to 0")
-                document_copy['premium_tier'] = 0
-        else:
-            # If no premium_tier in document, default to 0
-            document_copy['premium_tier'] = 0
+        # Convert premium_tier to int so it is always stored as an integer
+        premium_tier = document.get('premium_tier')
+        if premium_tier is None:
             logger.warning("No premium_tier found in database document, defaulting to 0")
+        premium_tier = _coerce_premium_tier(premium_tier)
             
-        instance = cls(db, **document_copy)
+        # Build from the document as-is and apply the coerced tier afterwards,
+        # rather than copying the whole document to replace one field
+        instance = cls(db, **document)
+        instance.premium_tier = premium_tier
         
         # Ensure all IDs are strings for consistent handling
         if hasattr(instance, 'guild_id'):
@@ -865,4 +787,6 @@ class Guild(BaseModel):
         if document is None:
             return None
             
-        return cls.create_from_db_document(document, None)
\ No newline at end of file
+        return cls.create_from_db_document(document, None)
+
+Guild._RESERVED = Guild._KNOWN_FIELDS | frozenset(dir(Guild))
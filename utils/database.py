@@ -11,9 +11,14 @@ import motor.motor_asyncio
 from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
 from bson import ObjectId
+from pymongo.errors import OperationFailure
 
 logger = logging.getLogger(__name__)
 
+# Case-insensitive collation for server_id lookups; queries must pass the same
+# collation to use the server_id_ci indexes
+SERVER_ID_COLLATION = {"locale": "en", "strength": 2}
+
 # Global database manager instance
 _db_manager = None
 
@@ -193,7 +198,15 @@ class DatabaseManager:
         await self._db.guilds.create_index("guild_id", unique=True)
         
         # Server indexes
+        try:
+            await self._db.servers.create_index("server_id", unique=True)
+        except OperationFailure as e:
+            # Existing duplicate server_ids block the unique index; keep starting
+            # up without it rather than failing database initialization
+            logger.error(f"Could not create unique servers.server_id index, check for duplicate server_ids: {e}")
+        await self._db.servers.create_index("server_id", name="server_id_ci", collation=SERVER_ID_COLLATION)
         await self._db.game_servers.create_index("server_id", unique=True)
+        await self._db.game_servers.create_index("server_id", name="server_id_ci", collation=SERVER_ID_COLLATION)
         await self._db.game_servers.create_index("guild_id")
         
         # Player indexes
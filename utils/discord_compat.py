@@ -7,7 +7,10 @@ layers as required by rule #2 in rules.md.
 This implementation adapts to the currently installed version while maintaining 
 direct import patterns that would be compatible with py-cord 2.6.1 whenever possible.
 """
+import functools
+import inspect
 import logging
+import operator
 import sys
 from typing import Any, Optional, Union, Dict, List, Callable
 
@@ -22,37 +25,24 @@ from discord.app_commands import Choice
 from discord import AppCommandOptionType  # Import from main discord module
 
 # Log discord version
-logger.info(f"Using discord library version: {discord.__version__}")
+if logger.isEnabledFor(logging.INFO):
+    logger.info("Using discord library version: %s", discord.__version__)
 
-# Determine if we're using discord.py or py-cord
-USING_PYCORD = 'py-cord' in discord.__version__ or discord.__version__.startswith('2.6')
+# Determine if we're using discord.py or py-cord once at import time; py-cord
+# identifies itself through __title__, which the version string cannot do
+# reliably now that discord.py also ships 2.6 releases
+USING_PYCORD = getattr(discord, '__title__', None) == 'pycord'
+USING_DISCORDPY = not USING_PYCORD
 
-# Direct method mappings to py-cord 2.6.1 app_commands methods
-def command(name=None, description=None, **kwargs):
-    """
-    Direct implementation of app_commands.command in py-cord 2.6.1
-    
-    Args:
-        name: Command name
-        description: Command description
-        **kwargs: Additional command parameters
-        
-    Returns:
-        Command decorator
-    """
-    return app_commands.command(name=name, description=description, **kwargs)
+# Direct method mappings to py-cord 2.6.1 app_commands methods; these need no
+# translation, so bind the library decorators instead of wrapping them
+command = app_commands.command
+describe = app_commands.describe
+guild_only = app_commands.guild_only
 
-def describe(**kwargs):
-    """
-    Direct implementation of app_commands.describe in py-cord 2.6.1
-    
-    Args:
-        **kwargs: Parameter name to description mapping
-        
-    Returns:
-        Function decorator
-    """
-    return app_commands.describe(**kwargs)
+def _autocomplete_for(param_name, callback_func):
+    """Build the autocomplete decorator for the legacy autocomplete(param_name) form"""
+    return app_commands.autocomplete(**{param_name: callback_func})
 
 def autocomplete(param_name=None, **kwargs):
     """
@@ -68,55 +58,157 @@ def autocomplete(param_name=None, **kwargs):
     Returns:
         Autocomplete decorator
     """
-    # Handle old-style call pattern
-    if param_name is not None and not kwargs:
-        def outer_decorator(callback_func):
-            return app_commands.autocomplete(**{param_name: callback_func})
-        return outer_decorator
+    # Modern py-cord 2.6.1 style
+    if param_name is None:
+        return app_commands.autocomplete(**kwargs)
     
     # Handle compatibility pattern
-    if 'callback' in kwargs and param_name is not None:
-        callback = kwargs.pop('callback')
-        return app_commands.autocomplete(**{param_name: callback})
+    if 'callback' in kwargs:
+        return _autocomplete_for(param_name, kwargs.pop('callback'))
     
-    # Modern py-cord 2.6.1 style
-    return app_commands.autocomplete(**kwargs)
-
-def guild_only():
-    """
-    Direct implementation of app_commands.guild_only in py-cord 2.6.1
+    # Handle old-style call pattern
+    if not kwargs:
+        return functools.partial(_autocomplete_for, param_name)
     
-    Returns:
-        Guild-only decorator
-    """
-    return app_commands.guild_only()
+    return app_commands.autocomplete(**kwargs)
 
 # Direct CommandTree implementation for py-cord 2.6.1
 class CommandTree:
     """Direct implementation of CommandTree for py-cord 2.6.1"""
     
+    __slots__ = ('bot', '_sync_commands', '_sync_params', '_synced_commands', '_synced_payload')
+    
     def __init__(self, bot):
         self.bot = bot
+        # Bind the library's sync_commands rather than the bot's own: bot
+        # subclasses such as PvPBot implement sync_commands on top of tree.sync
+        library_sync = getattr(Bot, 'sync_commands', None)
+        if library_sync is not None:
+            self._sync_commands = library_sync.__get__(bot)
+            self._sync_params = frozenset(inspect.signature(library_sync).parameters)
+        else:
+            self._sync_commands = None
+            self._sync_params = frozenset()
+        # Command objects and their serialized payload at the last sync;
+        # None until the first sync
+        self._synced_commands = None
+        self._synced_payload = None
+    
+    def _is_unchanged(self, pending):
+        """
+        Check whether the pending commands match the last sync
+        
+        Compares command identities first, so repeated syncs of an untouched
+        command table never serialize it; only re-created commands (e.g. after
+        a cog reload) are compared by payload.
+        
+        Args:
+            pending: The bot's pending application commands, or None
+        
+        Returns:
+            bool: True if a sync has happened and the commands are unchanged
+        """
+        synced = self._synced_commands
+        if synced is None:
+            return False
+        if pending is None:
+            return True
+        if len(pending) == len(synced) and all(map(operator.is_, pending, synced)):
+            return True
+        if [cmd.to_dict() for cmd in pending] == self._synced_payload:
+            self._synced_commands = tuple(pending)
+            return True
+        return False
     
-    async def sync(self, *args, **kwargs):
-        """Maps directly to sync_commands in py-cord 2.6.1"""
-        if hasattr(self.bot, 'sync_commands'):
-            return await self.bot.sync_commands(*args, **kwargs)
-        return []
+    async def sync(self, *args, guild=None, force=False, **kwargs):
+        """
+        Maps directly to sync_commands in py-cord 2.6.1
+        
+        py-cord registers global and guild-scoped commands together, with a
+        single bulk overwrite request per scope, so ``guild`` only exists for
+        discord.py call compatibility. Repeated calls (e.g. from on_ready after
+        every reconnect, or once per guild) are skipped while the command table
+        is unchanged, unless force=True is passed.
+        
+        Args:
+            guild: Ignored; accepted for discord.py compatibility
+            force: Sync even if the command table is unchanged
+            **kwargs: Passed to sync_commands where it accepts them
+        
+        Returns:
+            Result of sync_commands, or an empty list if skipped
+        """
+        if self._sync_commands is None:
+            return []
+        pending = getattr(self.bot, 'pending_application_commands', None)
+        if not force and self._is_unchanged(pending):
+            return []
+        params = self._sync_params
+        if force and 'force' in params:
+            kwargs['force'] = True
+        if 'method' in params:
+            kwargs.setdefault('method', 'bulk')
+        result = await self._sync_commands(*args, **kwargs)
+        if pending is None:
+            self._synced_commands = ()
+        else:
+            self._synced_commands = tuple(pending)
+            self._synced_payload = [cmd.to_dict() for cmd in pending]
+        return result
 
-# Bot patch for tree attribute compatibility
-if not hasattr(Bot, '_tree_patched'):
-    original_bot_init = Bot.__init__
+# Bot base class with a tree attribute for py-cord 2.6.1
+if hasattr(Bot, 'tree'):
+    # discord.py bots already expose their CommandTree
+    TreeBot = Bot
+else:
+    class TreeBot(Bot):
+        """Bot that exposes a CommandTree as ``tree`` like discord.py does"""
+
+        @functools.cached_property
+        def tree(self):
+            """CommandTree for this bot, created on first access"""
+            return CommandTree(self)
+
+@functools.lru_cache(maxsize=512)
+def _choices_for_key(choices_key):
+    """Build the Choice objects for a tuple of (name, name type, value, value type) entries"""
+    choice_cls = Choice
+    return tuple(choice_cls(name=str(name), value=value) for name, _, value, _ in choices_key)
+
+def build_choices(choices):
+    """
+    Build Choice objects from a list of choice dicts
     
-    def patched_bot_init(self, *args, **kwargs):
-        original_bot_init(self, *args, **kwargs)
-        if not hasattr(self, 'tree'):
-            self.tree = CommandTree(self)
+    Cogs pass the same constant choice lists on every load, so lists made up of
+    complete dict choices are memoized and share one set of Choice objects.
+    The name and value types are part of the cache key because lru_cache
+    compares keys by equality, which would otherwise merge e.g. 1, 1.0 and True.
+    Partial, unhashable or already formatted entries are built uncached.
     
-    # Apply the patch
-    Bot.__init__ = patched_bot_init
-    Bot._tree_patched = True
-    logger.info("Added tree attribute to Bot for py-cord 2.6.1 compatibility")
+    Args:
+        choices: List of choice dictionaries with name and value keys, or
+            Choice objects
+        
+    Returns:
+        List of Choice objects
+    """
+    try:
+        choices_key = tuple(
+            (choice['name'], type(choice['name']), choice['value'], type(choice['value']))
+            for choice in choices
+        )
+        return list(_choices_for_key(choices_key))
+    except (KeyError, TypeError):
+        choice_cls = Choice
+        return [
+            choice_cls(name=str(choice.get('name', '')), value=choice.get('value', ''))
+            if isinstance(choice, dict) else choice
+            for choice in choices
+        ]
+
+def clear_choice_cache():
+    """Clear the memoized choice lists built by build_choices"""
+    _choices_for_key.cache_clear()
 
 def create_option(name: str, 
                  description: str, 
@@ -144,15 +236,7 @@ def create_option(name: str,
     description = description or "No description provided"
     
     # Format choices
-    formatted_choices = []
-    if choices:
-        for choice in choices:
-            if isinstance(choice, dict):
-                choice_name = str(choice.get('name', ''))
-                choice_value = choice.get('value', '')
-                formatted_choices.append(app_commands.Choice(name=choice_name, value=choice_value))
-            else:
-                formatted_choices.append(choice)
+    formatted_choices = build_choices(choices) if choices else []
     
     # Return option description
     return {
@@ -163,6 +247,10 @@ def create_option(name: str,
         'choices': formatted_choices
     }
 
+# The app_commands module resolved at import; prefer this over calling
+# get_app_commands_module() in new code
+APP_COMMANDS_MODULE = app_commands
+
 def get_app_commands_module():
     """
     Get the Discord app_commands module directly from py-cord 2.6.1
@@ -170,4 +258,4 @@ def get_app_commands_module():
     Returns:
         discord.app_commands module
     """
-    return app_commands
\ No newline at end of file
+    return APP_COMMANDS_MODULE
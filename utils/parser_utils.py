@@ -11,6 +11,8 @@ This module provides:
 """
 import logging
 import os
+import sys
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Set, Tuple
 
@@ -25,69 +27,165 @@ from utils.path_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Event type groupings used by event hashing and categorize_event
+_KILL_EVENT_TYPES = frozenset({"kill", "suicide"})
+_CONNECTION_EVENT_TYPES = frozenset({"register", "unregister", "join", "kick"})
+_GAME_EVENT_TYPES = frozenset({"airdrop", "helicrash", "trader", "convoy"})
+
+class BloomFilter:
+    """Fixed-size Bloom filter for probabilistic membership of hashable keys
+
+    Uses one bit per slot and double hashing to derive the probe positions, so
+    memory stays constant no matter how many keys are added. Lookups may return
+    false positives (at a rate set by the size) but never false negatives.
+    """
+
+    def __init__(self, size_bits: int = 1 << 20, num_hashes: int = 7):
+        """Initialize an empty filter
+
+        Args:
+            size_bits: Number of bits in the filter (default 1M bits / 128 KB,
+                giving a ~7e-6 false positive rate at 30k keys)
+            num_hashes: Number of bit positions probed per key
+        """
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self.bits = bytearray((size_bits + 7) // 8)
+
+    def _probe_start(self, key: Any) -> Tuple[int, int]:
+        """Get the first probe position and the step between probes for a key"""
+        # Mix the builtin hash (splitmix64 finalizer) so small or sequential hash
+        # values still spread across the filter, then split it into the two
+        # double-hashing halves
+        mixed = hash(key) & 0xFFFFFFFFFFFFFFFF
+        mixed = ((mixed ^ (mixed >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        mixed = ((mixed ^ (mixed >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        mixed ^= mixed >> 31
+        size_bits = self.size_bits
+        return (mixed >> 32) % size_bits, ((mixed & 0xFFFFFFFF) | 1) % size_bits
+
+    def __contains__(self, key: Any) -> bool:
+        bits = self.bits
+        size_bits = self.size_bits
+        pos, step = self._probe_start(key)
+        for _ in range(self.num_hashes):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+            pos += step
+            if pos >= size_bits:
+                pos -= size_bits
+        return True
+
+    def add(self, key: Any):
+        """Add a key to the filter
+
+        Args:
+            key: Hashable key
+        """
+        bits = self.bits
+        size_bits = self.size_bits
+        pos, step = self._probe_start(key)
+        for _ in range(self.num_hashes):
+            bits[pos >> 3] |= 1 << (pos & 7)
+            pos += step
+            if pos >= size_bits:
+                pos -= size_bits
+
+    def check_and_add(self, key: Any, previous: Optional["BloomFilter"] = None) -> bool:
+        """Add a key to the filter, reporting whether it was already present
+
+        The probe positions are computed once and also tested against
+        ``previous``, which must have the same size and number of hashes.
+
+        Args:
+            key: Hashable key
+            previous: Optional filter of an earlier window to check as well
+
+        Returns:
+            bool: True if the key was (probably) already in this filter or previous
+        """
+        bits = self.bits
+        size_bits = self.size_bits
+        previous_bits = previous.bits if previous is not None else None
+        present = True
+        in_previous = previous_bits is not None
+        pos, step = self._probe_start(key)
+        for _ in range(self.num_hashes):
+            index = pos >> 3
+            mask = 1 << (pos & 7)
+            if not bits[index] & mask:
+                present = False
+                bits[index] |= mask
+            if in_previous and not previous_bits[index] & mask:
+                in_previous = False
+            pos += step
+            if pos >= size_bits:
+                pos -= size_bits
+        return present or in_previous
+
 class ParserCoordinator:
     """Coordinates between the three parser subsystems to avoid duplicate events"""
     
+    __slots__ = (
+        "last_processed_csv_timestamps",
+        "last_processed_log_timestamps",
+        "processed_event_hashes",
+        "previous_event_hashes",
+        "recent_event_window",
+        "_hashes_rotated_at",
+    )
+    
     def __init__(self):
         """Initialize parser coordinator"""
         self.last_processed_csv_timestamps = {}  # server_id -> timestamp
         self.last_processed_log_timestamps = {}  # server_id -> timestamp
-        self.processed_event_hashes = set()  # Set to track processed event hashes
+        self.processed_event_hashes = BloomFilter()  # Event hashes seen in the current window
+        self.previous_event_hashes = BloomFilter()  # Event hashes seen in the previous window
         self.recent_event_window = 3600  # 1 hour window for deduplication
+        self._hashes_rotated_at = time.monotonic()
         
-    def generate_event_hash(self, event: Dict[str, Any]) -> str:
+    def generate_event_hash(self, event: Dict[str, Any]) -> int:
         """Generate a hash for an event to check for duplicates
         
+        The hash is a 64-bit fingerprint of the event's identifying fields,
+        computed from a tuple so no intermediate string is built. It is only
+        stable within a process, which is all the in-memory dedupe needs.
+        
         Args:
             event: Event dictionary
             
         Returns:
-            str: Hash string
+            int: Event fingerprint
         """
+        # Normalize the timestamp once for every event type
+        timestamp = event.get("timestamp", "")
+        if timestamp.__class__ is datetime:
+            timestamp = timestamp.isoformat()
+        event_type = event.get("event_type")
+        
         # For kill events
         if "killer_id" in event and "victim_id" in event:
-            timestamp = event.get("timestamp", "")
-            if isinstance(timestamp, datetime):
-                timestamp = timestamp.isoformat()
-                
-            # Create a unique string from key event properties
-            hash_string = f"{timestamp}_{event.get('killer_id', '')}_{event.get('victim_id', '')}_{event.get('weapon', '')}"
-            return hash_string
+            # Fingerprint the key event properties
+            return hash(("kill", timestamp, event.get("killer_id", ""), event.get("victim_id", ""), event.get("weapon", "")))
             
         # For mission events
-        elif "event_type" in event and event.get("event_type") == "mission":
-            timestamp = event.get("timestamp", "")
-            if isinstance(timestamp, datetime):
-                timestamp = timestamp.isoformat()
-                
-            hash_string = f"{timestamp}_{event.get('mission_name', '')}_{event.get('location', '')}"
-            return hash_string
+        if event_type == "mission":
+            return hash(("mission", timestamp, event.get("mission_name", ""), event.get("location", "")))
             
         # For other game events (airdrop, helicrash, etc.)
-        elif "event_type" in event and event.get("event_type") in ["airdrop", "helicrash", "trader", "convoy"]:
-            timestamp = event.get("timestamp", "")
-            if isinstance(timestamp, datetime):
-                timestamp = timestamp.isoformat()
-                
-            hash_string = f"{timestamp}_{event.get('event_type', '')}_{event.get('event_id', '')}"
-            return hash_string
+        if event_type in _GAME_EVENT_TYPES:
+            return hash(("game_event", timestamp, event_type, event.get("event_id", "")))
             
         # For connection events
-        elif "event_type" in event and event.get("event_type") in ["register", "unregister", "join", "kick"]:
-            timestamp = event.get("timestamp", "")
-            if isinstance(timestamp, datetime):
-                timestamp = timestamp.isoformat()
-                
-            hash_string = f"{timestamp}_{event.get('event_type', '')}_{event.get('player_id', '')}"
-            return hash_string
+        if event_type in _CONNECTION_EVENT_TYPES:
+            return hash(("connection", timestamp, event_type, event.get("player_id", "")))
             
-        # Fallback for unknown event types
-        else:
-            timestamp = event.get("timestamp", "")
-            if isinstance(timestamp, datetime):
-                timestamp = timestamp.isoformat()
-                
-            return f"{timestamp}_{hash(str(event))}"
+        # Fallback for unknown event types: fingerprint all items, without
+        # rendering the whole dict to a string where possible
+        try:
+            return hash(("unknown", timestamp, frozenset(event.items())))
+        except TypeError:
+            return hash(("unknown", timestamp, str(event)))
     
     def is_duplicate_event(self, event: Dict[str, Any]) -> bool:
         """Check if an is not None event has already been processed
@@ -98,28 +196,24 @@ class ParserCoordinator:
         Returns:
             bool: True if duplicate, False otherwise
         """
+        self._rotate_event_hashes()
         event_hash = self.generate_event_hash(event)
         
-        if event_hash in self.processed_event_hashes:
-            return True
-            
-        # Add to processed set
-        self.processed_event_hashes.add(event_hash)
-        
-        # Keep the set from growing too large by periodically pruning old entries
-        self._prune_old_hashes()
-        
-        return False
+        # Check both windows with one set of probes; the hash is always added to
+        # the current window so a repeat stays known after the next rotation
+        return self.processed_event_hashes.check_and_add(event_hash, self.previous_event_hashes)
     
-    def _prune_old_hashes(self):
-        """Remove old event hashes to prevent memory growth"""
-        # Every 1000 events, check if we is not None should prune
-        if len(self.processed_event_hashes) > 10000:
-            # Keep only the most recent 1000 events
-            # In a real implementation this would be time-based, but
-            # that would require storing timestamps with each hash
-            if len(self.processed_event_hashes) > 1000:
-                self.processed_event_hashes = set(list(self.processed_event_hashes)[-1000:])
+    def _rotate_event_hashes(self):
+        """Start a new deduplication window once the current one has expired
+        
+        Two filters are kept so events from the end of the last window are
+        still recognized, bounding memory to two fixed-size filters.
+        """
+        now = time.monotonic()
+        if now - self._hashes_rotated_at >= self.recent_event_window:
+            self.previous_event_hashes = self.processed_event_hashes
+            self.processed_event_hashes = BloomFilter()
+            self._hashes_rotated_at = now
     
     def update_csv_timestamp(self, server_id: str, timestamp: datetime):
         """Update last processed CSV timestamp for a server
@@ -171,14 +265,11 @@ class ParserCoordinator:
         Returns:
             bool: True if should is not None process, False otherwise
         """
-        last_timestamp = self.get_last_csv_timestamp(server_id)
+        last_timestamp = self.last_processed_csv_timestamps.get(server_id)
         
-        # If we haven't processed any CSV for this server, process it
-        if last_timestamp is None:
-            return True
-            
-        # Process only if it's newer than the last processed timestamp
-        return csv_timestamp > last_timestamp
+        # Process if nothing has been processed for this server yet, or if
+        # it's newer than the last processed timestamp
+        return last_timestamp is None or csv_timestamp > last_timestamp
     
     def should_process_log(self, server_id: str, log_timestamp: datetime) -> bool:
         """Check if a is not None log entry should be processed
@@ -190,18 +281,100 @@ class ParserCoordinator:
         Returns:
             bool: True if should is not None process, False otherwise
         """
-        last_timestamp = self.get_last_log_timestamp(server_id)
+        last_timestamp = self.last_processed_log_timestamps.get(server_id)
         
-        # If we haven't processed any logs for this server, process it
-        if last_timestamp is None:
-            return True
-            
-        # Process only if it's newer than the last processed timestamp
-        return log_timestamp > last_timestamp
+        # Process if nothing has been processed for this server yet, or if
+        # it's newer than the last processed timestamp
+        return last_timestamp is None or log_timestamp > last_timestamp
 
 # Create a global coordinator instance
 parser_coordinator = ParserCoordinator()
 
+# Post-April format weapon values that always indicate a suicide
+_SUICIDE_WEAPONS = frozenset({"suicide_by_relocation", "suicide", "suicide_fall"})
+# Weapon substrings indicating a suicide by special method ("fall" and "drown"
+# also cover "falling" and "drowning")
+_SUICIDE_KEYWORDS = ("suicide", "fall", "drown", "relog", "relocation")
+
+# Identifier and string fields normalize_event_data replaces None with "" in
+_STRING_FIELDS = ("killer_id", "victim_id", "player_id", "killer_name", "victim_name", "player_name", "weapon", "location")
+_MISSING = object()
+# Low-cardinality string fields that repeat across many events and are interned
+_INTERNED_FIELDS = ("weapon", "killer_console", "victim_console", "event_type", "location")
+
+# Bound once so the per-event normalization path avoids repeated attribute lookups
+_fromisoformat = datetime.fromisoformat
+_strptime = datetime.strptime
+_utcnow = datetime.utcnow
+
+# Non-ISO timestamp formats seen in parser output, keyed by the characters at
+# offsets 4, 10 and 19 so the matching format is tried first
+_TIMESTAMP_FORMATS = {
+    (".", "-", ""): "%Y.%m.%d-%H.%M.%S",
+    (".", "-", ":"): "%Y.%m.%d-%H.%M.%S:%f",
+    ("-", " ", ""): "%Y-%m-%d %H:%M:%S",
+    ("-", " ", "."): "%Y-%m-%d %H:%M:%S.%f",
+}
+
+def _parse_timestamp(timestamp: str) -> Optional[datetime]:
+    """Parse a timestamp string in any of the supported parser formats
+    
+    Args:
+        timestamp: Timestamp string
+        
+    Returns:
+        datetime or None: Parsed timestamp, or None if no format matched
+    """
+    # Deadside CSV timestamps (YYYY.MM.DD-HH.MM.SS) are fixed width, so slice
+    # the fields directly instead of going through strptime
+    if len(timestamp) == 19 and timestamp[4] == "." and timestamp[10] == "-":
+        try:
+            return datetime(
+                int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19])
+            )
+        except ValueError:
+            pass
+    
+    try:
+        return _fromisoformat(timestamp)
+    except ValueError:
+        pass
+    
+    # Try the format matching the timestamp's shape first, then the rest
+    likely_format = _TIMESTAMP_FORMATS.get((timestamp[4:5], timestamp[10:11], timestamp[19:20]))
+    if likely_format is not None:
+        try:
+            return _strptime(timestamp, likely_format)
+        except ValueError:
+            pass
+    for fmt in _TIMESTAMP_FORMATS.values():
+        if fmt is likely_format:
+            continue
+        try:
+            return _strptime(timestamp, fmt)
+        except ValueError:
+            continue
+    
+    return None
+
+def _parse_distance(distance: str) -> int:
+    """Convert a distance string to an integer, truncating any fraction
+    
+    Args:
+        distance: Distance string
+        
+    Returns:
+        int: Distance, or 0 if it cannot be parsed
+    """
+    # Plain digit strings skip the float round-trip
+    if distance.isdecimal():
+        return int(distance)
+    try:
+        return int(float(distance))
+    except (ValueError, OverflowError):
+        return 0
+
 def normalize_event_data(event: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize event data from different parser sources
     
@@ -221,36 +394,15 @@ def normalize_event_data(event: Dict[str, Any]) -> Dict[str, Any]:
     if "timestamp" in normalized:
         timestamp = normalized["timestamp"]
         if isinstance(timestamp, str):
-            try:
-                # Try ISO format first
-                normalized["timestamp"] = datetime.fromisoformat(timestamp)
-            except ValueError:
-                try:
-                    # Try other common formats
-                    common_formats = [
-                        "%Y.%m.%d-%H.%M.%S",
-                        "%Y.%m.%d-%H.%M.%S:%f",
-                        "%Y-%m-%d %H:%M:%S",
-                        "%Y-%m-%d %H:%M:%S.%f"
-                    ]
-                    
-                    for fmt in common_formats:
-                        try:
-                            normalized["timestamp"] = datetime.strptime(timestamp, fmt)
-                            break
-                        except ValueError:
-                            continue
-                            
-                    # If we still haven't parsed it, use current time
-                    if isinstance(normalized["timestamp"], str):
-                        logger.warning(f"Could not parse timestamp: {timestamp}")
-                        normalized["timestamp"] = datetime.utcnow()
-                except Exception as e:
-                    logger.error(f"Error parsing timestamp '{timestamp}': {e}")
-                    normalized["timestamp"] = datetime.utcnow()
+            parsed_timestamp = _parse_timestamp(timestamp)
+            if parsed_timestamp is None:
+                # If we couldn't parse it, use current time
+                logger.warning(f"Could not parse timestamp: {timestamp}")
+                parsed_timestamp = _utcnow()
+            normalized["timestamp"] = parsed_timestamp
     else:
         # If no timestamp, add current time
-        normalized["timestamp"] = datetime.utcnow()
+        normalized["timestamp"] = _utcnow()
     
     # Normalize player identifiers
     if "killer_id" in normalized and normalized["killer_id"] is None:
@@ -292,28 +444,25 @@ def normalize_event_data(event: Dict[str, Any]) -> Dict[str, Any]:
             # Regular kill event
             normalized["event_type"] = "kill"
         
-    if "victim_id" in normalized and normalized["victim_id"] is None:
-        normalized["victim_id"] = ""
-        
-    if "player_id" in normalized and normalized["player_id"] is None:
-        normalized["player_id"] = ""
-    
-    # Normalize string fields
-    for field in ["killer_name", "victim_name", "player_name", "weapon", "location"]:
-        if field in normalized and normalized[field] is None:
+    # Normalize identifier and string fields in one pass (absent fields stay absent)
+    get = normalized.get
+    for field in _STRING_FIELDS:
+        if get(field, _MISSING) is None:
             normalized[field] = ""
     
-    # Normalize numeric fields
-    for field in ["distance"]:
-        if field in normalized and normalized[field] is None:
-            normalized[field] = 0
-            
-        # Convert string distances to integers
-        if field in normalized and isinstance(normalized[field], str):
-            try:
-                normalized[field] = int(float(normalized[field]))
-            except (ValueError, TypeError):
-                normalized[field] = 0
+    # Share one string object per distinct weapon/console/location value so
+    # long-lived event lists don't hold thousands of equal copies
+    for field in _INTERNED_FIELDS:
+        value = get(field)
+        if value.__class__ is str:
+            normalized[field] = sys.intern(value)
+    
+    # Normalize numeric fields, converting string distances to integers
+    distance = get("distance", _MISSING)
+    if distance is None:
+        normalized["distance"] = 0
+    elif isinstance(distance, str):
+        normalized["distance"] = _parse_distance(distance)
     
     return normalized
 
@@ -333,24 +482,26 @@ def categorize_event(event: Dict[str, Any]) -> str:
     if "event_type" in event:
         event_type = event["event_type"]
         # If it's already categorized as kill or suicide by the normalizer
-        if event_type in ["kill", "suicide"]:
+        if event_type in _KILL_EVENT_TYPES:
             return event_type
         # Other event types
-        elif event_type in ["register", "unregister", "join", "kick"]:
+        elif event_type in _CONNECTION_EVENT_TYPES:
             return "connection"
         elif event_type == "mission":
             return "mission"
-        elif event_type in ["airdrop", "helicrash", "trader", "convoy"]:
+        elif event_type in _GAME_EVENT_TYPES:
             return "game_event"
     
+    # Lowercase the weapon once for all suicide checks below
+    has_weapon = "weapon" in event
+    weapon = str(event["weapon"] or "").lower() if has_weapon else ""
+    
     # Check for post-April format suicide indicators
     # These are specific to the post-April format with 9 fields
-    if "weapon" in event:
-        weapon = event.get("weapon", "").lower()
-        if weapon in ["suicide_by_relocation", "suicide", "suicide_fall"]:
-            # Log detection of post-April suicide format
-            logger.debug(f"Detected post-April format suicide by weapon: {weapon}")
-            return "suicide"
+    if weapon in _SUICIDE_WEAPONS:
+        # Log detection of post-April suicide format
+        logger.debug("Detected post-April format suicide by weapon: %s", weapon)
+        return "suicide"
     
     # Kill events have killer and victim fields (both formats)
     if "killer_id" in event and "victim_id" in event:
@@ -359,7 +510,7 @@ def categorize_event(event: Dict[str, Any]) -> str:
         
         # Check for suicide (by matching IDs) - works in both formats
         if killer_id and victim_id and killer_id == victim_id:
-            logger.debug(f"Detected suicide by matching IDs: {killer_id}")
+            logger.debug("Detected suicide by matching IDs: %s", killer_id)
             return "suicide"
             
         # Check for suicide (by matching names if IDs differ) - data inconsistency edge case
@@ -367,23 +518,19 @@ def categorize_event(event: Dict[str, Any]) -> str:
             killer_name = event.get("killer_name", "")
             victim_name = event.get("victim_name", "")
             if killer_name and victim_name and killer_name == victim_name:
-                logger.debug(f"Detected potential suicide by matching names: {killer_name}")
+                logger.debug("Detected potential suicide by matching names: %s", killer_name)
                 return "suicide"
         
         # Check for empty weapon field in suicide cases
-        if "weapon" in event and not event.get("weapon"):
+        if has_weapon and not weapon:
             if killer_id == victim_id:
                 logger.debug("Detected suicide with empty weapon field")
                 return "suicide"
         
         # Detect players trying to commit suicide by special methods (looking for keywords)
-        if "weapon" in event:
-            weapon = str(event.get("weapon", "")).lower()
-            suicide_keywords = ["suicide", "fall", "falling", "drown", "drowning", "relog", "relocation"]
-            for keyword in suicide_keywords:
-                if keyword in weapon:
-                    logger.debug(f"Detected suicide by keyword in weapon: {weapon}")
-                    return "suicide"
+        if has_weapon and any(keyword in weapon for keyword in _SUICIDE_KEYWORDS):
+            logger.debug("Detected suicide by keyword in weapon: %s", weapon)
+            return "suicide"
         
         # If we've gotten this far, it's probably a regular kill
         # For both pre-April and post-April formats
@@ -393,6 +540,6 @@ def categorize_event(event: Dict[str, Any]) -> str:
     if "player_id" in event and "action" in event:
         return "connection"
         
-    # Unknown event type
-    logger.debug(f"Unknown event type: {event}")
+    # Unknown event type (lazy formatting: the event is only stringified when debug logging is on)
+    logger.debug("Unknown event type: %s", event)
     return "unknown"
\ No newline at end of file
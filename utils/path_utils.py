@@ -1,18 +1,27 @@
 
-"""Path utilities for standardized file path handling across parsers"""
+"""Path utilities for standardized file path handling across parsers
+
+Path builders are pure functions of their arguments and are memoized, since
+they are called for every CSV file discovered and every log poll. The caches
+are typed so arguments that compare equal across types (e.g. 1, 1.0 and True)
+keep separate entries instead of returning a path formatted from another type.
+"""
 
 import os
 import logging
+import functools
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=512, typed=True)
 def clean_hostname(hostname: Optional[str]) -> str:
     """Remove port from hostname if present"""
     if not hostname:
         return "server"
-    return hostname.split(':')[0]
+    return hostname.partition(':')[0]
 
+@functools.lru_cache(maxsize=512, typed=True)
 def get_base_path(hostname: str, server_id: str, original_server_id: Optional[str] = None) -> str:
     """Get standardized base path for server
     
@@ -33,6 +42,7 @@ def get_base_path(hostname: str, server_id: str, original_server_id: Optional[st
     
     return os.path.join("/", f"{clean_host}_{path_server_id}")
 
+@functools.lru_cache(maxsize=512, typed=True)
 def get_log_path(hostname: str, server_id: str, original_server_id: Optional[str] = None) -> str:
     """Get standardized log file path
     
@@ -46,6 +56,7 @@ def get_log_path(hostname: str, server_id: str, original_server_id: Optional[str
     """
     return os.path.join(get_base_path(hostname, server_id, original_server_id), "Logs")
 
+@functools.lru_cache(maxsize=512, typed=True)
 def get_csv_path(hostname: str, server_id: str, world_dir: Optional[str] = None, original_server_id: Optional[str] = None) -> str:
     """Get standardized CSV file path
     
@@ -72,6 +83,7 @@ def get_csv_path(hostname: str, server_id: str, world_dir: Optional[str] = None,
     # Add world directory if specified, ensuring clean path joining
     return os.path.normpath(os.path.join(deathlogs_base, world_dir))
 
+@functools.lru_cache(maxsize=512, typed=True)
 def get_log_file_path(hostname: str, server_id: str, original_server_id: Optional[str] = None) -> str:
     """Get full path to Deadside.log
     
@@ -48,6 +48,87 @@ PREMIUM_FEATURES = {
     "premium_support": 1  # Available from Tier 1
 }
 
+def _build_tier_features() -> Dict[int, Tuple[str, ...]]:
+    """Compute the features available at each premium tier, including inherited ones.
+
+    A tier has access to every feature listed for it or any lower tier in
+    PREMIUM_TIERS, plus every PREMIUM_FEATURES entry whose minimum tier it meets.
+
+    Returns:
+        Dict[int, Tuple[str, ...]]: Mapping of tier -> available features
+    """
+    # Bucket PREMIUM_FEATURES by the tier that first unlocks them (anything
+    # below tier 0 unlocks at 0) so each tier only adds its own bucket
+    features_by_min_tier: Dict[int, List[str]] = {}
+    for feature, min_tier in PREMIUM_FEATURES.items():
+        features_by_min_tier.setdefault(max(min_tier, 0), []).append(feature)
+
+    tier_features = {}
+    # Running union of everything available so far, in one pass over the tiers;
+    # a dict keeps first-seen order so feature lists are the same on every run
+    available = {}
+    for tier in range(max(PREMIUM_TIERS) + 1):
+        available.update(dict.fromkeys(PREMIUM_TIERS.get(tier, {}).get("features", [])))
+        available.update(dict.fromkeys(features_by_min_tier.get(tier, ())))
+        tier_features[tier] = tuple(available)
+    return tier_features
+
+TIER_FEATURES = _build_tier_features()
+
+def _build_feature_bitmasks() -> Tuple[Dict[str, int], List[int]]:
+    """Encode each tier's available features as an integer bitmask.
+
+    Returns:
+        Tuple of (feature name -> bit, tier -> feature bitmask)
+    """
+    feature_names = dict.fromkeys(PREMIUM_FEATURES)
+    for features in TIER_FEATURES.values():
+        feature_names.update(dict.fromkeys(features))
+    feature_bits = {name: 1 << i for i, name in enumerate(feature_names)}
+
+    tier_bits = []
+    for tier in range(len(TIER_FEATURES)):
+        mask = 0
+        for feature in TIER_FEATURES[tier]:
+            mask |= feature_bits[feature]
+        tier_bits.append(mask)
+
+    return feature_bits, tier_bits
+
+FEATURE_BITS, TIER_FEATURE_BITS = _build_feature_bitmasks()
+_MAX_TIER = len(TIER_FEATURE_BITS) - 1
+
+def tier_has_feature(tier: int, feature_name: str) -> bool:
+    """Check whether a premium tier grants a feature, including inherited features.
+
+    Args:
+        tier: Premium tier as an integer (tiers above the highest defined tier
+            are treated as the highest tier)
+        feature_name: Name of the feature to check
+
+    Returns:
+        bool: True if the tier has access to the feature
+    """
+    bit = FEATURE_BITS.get(feature_name)
+    if bit is None or tier < 0:
+        return False
+    return (TIER_FEATURE_BITS[min(tier, _MAX_TIER)] & bit) != 0
+
+def get_tier_features(tier: int) -> Tuple[str, ...]:
+    """Get all features available at a premium tier, including inherited features.
+
+    Args:
+        tier: Premium tier as an integer (tiers above the highest defined tier
+            are treated as the highest tier)
+
+    Returns:
+        Tuple[str, ...]: Available features
+    """
+    if tier < 0:
+        # No tier inheritance applies; fall back to the base tier's listed features
+        return tuple(PREMIUM_TIERS.get(0, {}).get("features", []))
+    return TIER_FEATURES[min(tier, _MAX_TIER)]
+
 # Enhanced cache configuration
 FEATURE_ACCESS_CACHE_TTL = 300  # 5 minutes (short-term cache)
 PREMIUM_TIER_CACHE_TTL = 1800  # 30 minutes (medium-term cache)
@@ -13,11 +13,17 @@ from discord.app_commands import Choice
 # Import AppCommandOptionType directly from py-cord 2.6.1
 from discord.enums import AppCommandOptionType
 
+from utils.discord_compat import build_choices, clear_choice_cache
+
 # Create Option class alias for py-cord 2.6.1
 # In py-cord 2.6.1, options are defined through function parameter annotations
 # rather than through a separate Option class
 Option = app_commands.describe
 
+def clear_option_cache():
+    """Clear the memoized choice lists built by create_option."""
+    clear_choice_cache()
+
 def create_option(name: str, description: str, option_type, required=False, choices=None):
     """
     Create a command option compatible with py-cord 2.6.1.
@@ -37,14 +43,11 @@ def create_option(name: str, description: str, option_type, required=False, choi
         A parameter description dictionary for use in command registration
     """
     # Format choices if provided
-    formatted_choices = None
+    formatted_choices = []
     if choices:
-        if isinstance(choices[0], dict):
-            # Convert from dict format if needed
-            formatted_choices = [
-                app_commands.Choice(name=choice.get('name', ''), value=choice.get('value', ''))
-                for choice in choices
-            ]
+        if type(choices[0]) is dict:
+            # Convert from dict format, sharing the choice memo with discord_compat
+            formatted_choices = build_choices(choices)
         else:
             # Already in correct format
             formatted_choices = choices
@@ -56,5 +59,5 @@ def create_option(name: str, description: str, option_type, required=False, choi
         'description': description,
         'type': option_type,
         'required': required,
-        'choices': formatted_choices if formatted_choices else []
+        'choices': formatted_choices
     }
\ No newline at end of file